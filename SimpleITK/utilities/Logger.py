@@ -20,6 +20,20 @@ import SimpleITK as sitk
 import logging
 
 
+class _LazyStrip:
+    """Defers stripping a message's trailing newline until a handler actually
+    formats the log record, so filtered messages never pay for the string
+    copy."""
+
+    __slots__ = ("s",)
+
+    def __init__(self, s):
+        self.s = s
+
+    def __str__(self):
+        return self.s.rstrip()
+
+
 class Logger(sitk.LoggerBase):
     """
     Adapts SimpleITK messages to be handled by a Python Logger object.
@@ -69,17 +83,24 @@ class Logger(sitk.LoggerBase):
 
     def DisplayText(self, s):
         # Remove newline endings from SimpleITK/ITK messages since the Python
-        # logger adds during output.
-        self._logger.info(s.rstrip())
+        # logger adds during output. The level check avoids record creation
+        # for disabled levels, and _LazyStrip postpones the strip until a
+        # handler formats the message.
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("%s", _LazyStrip(s))
 
     def DisplayErrorText(self, s):
-        self._logger.error(s.rstrip())
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error("%s", _LazyStrip(s))
 
     def DisplayWarningText(self, s):
-        self._logger.warning(s.rstrip())
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning("%s", _LazyStrip(s))
 
     def DisplayGenericOutputText(self, s):
-        self._logger.info(s.rstrip())
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("%s", _LazyStrip(s))
 
     def DisplayDebugText(self, s):
-        self._logger.debug(s.rstrip())
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("%s", _LazyStrip(s))
@@ -16,6 +16,8 @@
 #
 # ========================================================================
 
+import importlib.util
+
 from .Logger import Logger
 from .slice_by_slice import slice_by_slice
 from .make_isotropic import make_isotropic
@@ -29,6 +31,17 @@ except ImportError:
     __version__ = "unknown version"
 
 
+def __getattr__(name):
+    # PEP 562 lazy resolution of the VTK helpers, so importing
+    # SimpleITK.utilities does not pay for the heavy vtk import unless the
+    # helpers are actually used.
+    if name in ("sitk2vtk", "vtk2sitk", "sitk_series_to_vtk"):
+        from . import vtk
+
+        return getattr(vtk, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Logger",
     "slice_by_slice",
@@ -38,3 +51,9 @@ __all__ = [
     "resize",
     "__version__",
 ]
+
+# The VTK helpers are only advertised for star-import when the optional vtk
+# dependency is available, otherwise resolving them through __getattr__ would
+# fail the import.
+if importlib.util.find_spec("vtk") is not None:
+    __all__ += ["sitk2vtk", "sitk_series_to_vtk", "vtk2sitk"]
@@ -17,13 +17,54 @@
 # ========================================================================
 
 import dask.array as da
+import numpy as np
+from dask.base import tokenize
 import SimpleITK as sitk
+import threading
 from pathlib import Path
 from typing import Union, Tuple
 
 PathType = Union[str, Path]
 ChunkType = Union[int, Tuple]
 
+# Per-thread cache of ImageFileReader objects with the image information already
+# read, so each dask worker thread/process parses a file's header once instead
+# of once per block. Thread-local storage keeps readers from being shared
+# across concurrently executing blocks.
+_thread_local = threading.local()
+
+
+class _ImageBackedArray(np.ndarray):
+    """A NumPy array viewing a SimpleITK image buffer, holding a reference to
+    the image so the buffer stays valid for the lifetime of the array (and of
+    any downstream views, through the base chain)."""
+
+    _keep_alive = None
+
+
+def _as_array_view(sitk_img: sitk.Image) -> np.ndarray:
+    arr = sitk.GetArrayViewFromImage(sitk_img).view(_ImageBackedArray)
+    arr._keep_alive = sitk_img
+    return arr
+
+
+def _get_cached_reader(filename: str) -> sitk.ImageFileReader:
+    try:
+        cache = _thread_local.reader_cache
+    except AttributeError:
+        cache = _thread_local.reader_cache = {}
+    reader = cache.get(filename)
+    if reader is None:
+        reader = sitk.ImageFileReader()
+        # Block-level parallelism belongs to the dask scheduler. Restricting
+        # the reader to one ITK thread avoids oversubscription when multiple
+        # blocks execute concurrently.
+        reader.SetNumberOfThreads(1)
+        reader.SetFileName(filename)
+        reader.ReadImageInformation()
+        cache[filename] = reader
+    return reader
+
 
 def from_sitk(filename: PathType, chunks: ChunkType = None) -> da.Array:
     """Reads the filename into a dask array with map_block.
@@ -31,6 +72,9 @@ def from_sitk(filename: PathType, chunks: ChunkType = None) -> da.Array:
     SimpleITK is used to "stream read" chunks from the file if supported, otherwise the entire image will be read for
     each chunk request.ITK support full streaming includes MHA, MRC, NRRD and NIFTI file formats.
 
+    Parallelism across chunks is assumed to be managed by the dask scheduler, so each chunk is read with a single ITK
+    thread to avoid oversubscribing the worker pool.
+
     :param filename: A path-like object to the location of an image file readable by SimpleITK.
     :param chunks: Please see dask documentation on chunks of dask arrays for supported formats. Chunk size can be tuned
         for performance based on continuously stored on disk, re-chunking, and downstream processes.
@@ -52,25 +96,40 @@ def from_sitk(filename: PathType, chunks: ChunkType = None) -> da.Array:
         if len(chunks) < len(img_shape):
             chunks = chunks + (-1,)
 
-    z = da.zeros(
-        shape=img_shape, dtype=sitk.extra._get_numpy_dtype(reader), chunks=chunks
+    full_size = reader.GetSize()
+    np_dtype = sitk.extra._get_numpy_dtype(reader)
+    normalized_chunks = da.core.normalize_chunks(
+        chunks, shape=img_shape, dtype=np_dtype
     )
 
-    def func(z, block_info=None):
-        _reader = sitk.ImageFileReader()
-        _reader.SetFileName(str(filename))
-        if block_info is not None:
-            if is_multi_component:
-                size = block_info[None]["chunk-shape"][-2::-1]
-                index = [al[0] for al in block_info[None]["array-location"][-2::-1]]
-            else:
-                size = block_info[None]["chunk-shape"][::-1]
-                index = [al[0] for al in block_info[None]["array-location"][::-1]]
+    def func(block_info=None):
+        if block_info is None:
+            return np.empty((0,) * len(img_shape), dtype=np_dtype)
+        _reader = _get_cached_reader(str(filename))
+        if is_multi_component:
+            size = block_info[None]["chunk-shape"][-2::-1]
+            index = [al[0] for al in block_info[None]["array-location"][-2::-1]]
+        else:
+            size = block_info[None]["chunk-shape"][::-1]
+            index = [al[0] for al in block_info[None]["array-location"][::-1]]
+        if tuple(size) == full_size and not any(index):
+            # The chunk covers the whole image, read it directly without the
+            # streamed extraction window. An empty extract size disables any
+            # extraction region left on the cached reader.
+            _reader.SetExtractSize([])
+        else:
             _reader.SetExtractIndex(index)
             _reader.SetExtractSize(size)
-            sitk_img = _reader.Execute()
-            return sitk.GetArrayFromImage(sitk_img)
-        return z
+        sitk_img = _reader.Execute()
+        return _as_array_view(sitk_img)
 
-    da_img = da.map_blocks(func, z, meta=z, name="from-sitk")
+    da_img = da.map_blocks(
+        func,
+        dtype=np_dtype,
+        chunks=normalized_chunks,
+        meta=np.empty((0,) * len(img_shape), dtype=np_dtype),
+        # The key must be unique per source file and chunking, otherwise two
+        # from_sitk arrays in one graph would deduplicate to a single layer.
+        name=f"from-sitk-{tokenize(str(filename), normalized_chunks)}",
+    )
     return da_img
@@ -17,6 +17,18 @@
 # ========================================================================
 
 import SimpleITK as sitk
+import numpy as np
+
+
+def _not_equal_mask(image: sitk.Image, value: float) -> sitk.Image:
+    """Compute a float32 mask of pixels differing from value in a single pass,
+    avoiding the boolean intermediate image of Cast(image != value)."""
+    arr = sitk.GetArrayViewFromImage(image)
+    mask_arr = np.empty(arr.shape, dtype=np.float32)
+    np.not_equal(arr, value, out=mask_arr)
+    mask = sitk.GetImageFromArray(mask_arr)
+    mask.CopyInformation(image)
+    return mask
 
 
 def fft_based_translation_initialization(
@@ -65,8 +77,13 @@ def fft_based_translation_initialization(
     sigma = fixed.GetSpacing()[0]
     pixel_type = sitk.sitkFloat32
 
-    fixed = sitk.Cast(sitk.SmoothingRecursiveGaussian(fixed, sigma), pixel_type)
-    moving = sitk.Cast(sitk.SmoothingRecursiveGaussian(moving, sigma), pixel_type)
+    # Cast to float32 before smoothing so the Gaussian runs once in the
+    # working precision, instead of smoothing in the input pixel type and
+    # casting the result. The filter object is reused for both inputs.
+    gaussian = sitk.SmoothingRecursiveGaussianImageFilter()
+    gaussian.SetSigma(sigma)
+    fixed = gaussian.Execute(sitk.Cast(fixed, pixel_type))
+    moving = gaussian.Execute(sitk.Cast(moving, pixel_type))
 
     if masked_pixel_value is None:
         xcorr = sitk.FFTNormalizedCorrelation(
@@ -78,33 +95,69 @@ def fft_based_translation_initialization(
         xcorr = sitk.MaskedFFTNormalizedCorrelation(
             fixed,
             moving,
-            sitk.Cast(fixed != masked_pixel_value, pixel_type),
-            sitk.Cast(moving != masked_pixel_value, pixel_type),
+            _not_equal_mask(fixed, masked_pixel_value),
+            _not_equal_mask(moving, masked_pixel_value),
             requiredFractionOfOverlappingPixels=required_fraction_of_overlapping_pixels,
         )
 
-    xcorr = sitk.SmoothingRecursiveGaussian(xcorr, sigma)
+    # The smoothed input copies are no longer needed once the correlation image
+    # is computed. Release them before the peak search allocates additional
+    # full-size images to reduce peak memory usage.
+    del fixed, moving
 
-    cc = sitk.ConnectedComponent(sitk.RegionalMaxima(xcorr, fullyConnected=True))
-    stats = sitk.LabelStatisticsImageFilter()
-    stats.Execute(xcorr, cc)
-    labels = sorted(stats.GetLabels(), key=lambda l: stats.GetMean(l))
+    xcorr = sitk.SmoothingRecursiveGaussian(xcorr, sigma)
 
-    peak_bb = stats.GetBoundingBox(labels[-1])
-    # Add 0.5 for center of voxel on continuous index
-    peak_idx = [
-        (min_idx + max_idx) / 2.0 + 0.5
-        for min_idx, max_idx in zip(peak_bb[0::2], peak_bb[1::2])
-    ]
+    if masked_pixel_value is None:
+        # The translation peak is the global maximum of the smoothed
+        # correlation image, found directly with a single argmax pass instead
+        # of the RegionalMaxima/ConnectedComponent/LabelStatistics pipeline
+        # and its full-size label images.
+        arr = sitk.GetArrayViewFromImage(xcorr)
+        peak_zyx = np.unravel_index(np.argmax(arr), arr.shape)
+        # Add 0.5 for center of voxel on continuous index
+        peak_idx = [i + 0.5 for i in peak_zyx[::-1]]
+        peak_value = float(arr[peak_zyx])
+    else:
+        # The masked correlation can contain degenerate values outside the
+        # valid overlap region, so keep the label-based peak estimate there.
+        cc = sitk.ConnectedComponent(sitk.RegionalMaxima(xcorr, fullyConnected=True))
+        stats = sitk.LabelStatisticsImageFilter()
+        stats.Execute(xcorr, cc)
+        del cc
+        peak_label = max(stats.GetLabels(), key=stats.GetMean)
+
+        peak_bb = stats.GetBoundingBox(peak_label)
+        # Add 0.5 for center of voxel on continuous index
+        peak_idx = [
+            (min_idx + max_idx) / 2.0 + 0.5
+            for min_idx, max_idx in zip(peak_bb[0::2], peak_bb[1::2])
+        ]
+        peak_value = stats.GetMean(peak_label)
 
     peak_pt = xcorr.TransformContinuousIndexToPhysicalPoint(peak_idx)
-    peak_value = stats.GetMean(labels[-1])
 
-    center_pt = xcorr.TransformContinuousIndexToPhysicalPoint(
-        [p / 2.0 for p in xcorr.GetSize()]
-    )
-
-    translation = [c - p for c, p in zip(center_pt, peak_pt)]
+    # Unrolled for the common 2D/3D cases to avoid generator and zip overhead
+    # when called in an outer loop (multi-resolution, multi-tile).
+    size = xcorr.GetSize()
+    if len(size) == 2:
+        center_pt = xcorr.TransformContinuousIndexToPhysicalPoint(
+            (size[0] / 2.0, size[1] / 2.0)
+        )
+        translation = (center_pt[0] - peak_pt[0], center_pt[1] - peak_pt[1])
+    elif len(size) == 3:
+        center_pt = xcorr.TransformContinuousIndexToPhysicalPoint(
+            (size[0] / 2.0, size[1] / 2.0, size[2] / 2.0)
+        )
+        translation = (
+            center_pt[0] - peak_pt[0],
+            center_pt[1] - peak_pt[1],
+            center_pt[2] - peak_pt[2],
+        )
+    else:
+        center_pt = xcorr.TransformContinuousIndexToPhysicalPoint(
+            [p / 2.0 for p in size]
+        )
+        translation = [c - p for c, p in zip(center_pt, peak_pt)]
     if initial_transform is not None:
         offset = initial_transform.TransformVector(translation, point=[0, 0])
 
@@ -20,6 +20,18 @@ import SimpleITK as sitk
 import numpy as np
 import itertools
 
+# Identity direction cosine matrices as flat tuples, cached per dimension so
+# repeated calls avoid rebuilding NumPy identity temporaries.
+_identity_directions = {}
+
+
+def _identity_direction(dim):
+    identity = _identity_directions.get(dim)
+    if identity is None:
+        identity = tuple(np.identity(dim).ravel())
+        _identity_directions[dim] = identity
+    return identity
+
 
 def make_isotropic(
     image,
@@ -71,16 +83,26 @@ def make_isotropic(
     new_origin = image.GetOrigin()
     # Only need to standardize axes if user requested and the original
     # axes were not standard.
-    if standardize_axes and not np.array_equal(
-        np.array(new_direction), np.identity(image.GetDimension()).ravel()
+    if standardize_axes and tuple(new_direction) != _identity_direction(
+        image.GetDimension()
     ):
-        new_direction = np.identity(image.GetDimension()).ravel()
+        new_direction = _identity_direction(image.GetDimension())
         # Compute bounding box for the original, non standard axes image.
-        boundary_points = []
-        for boundary_index in list(
-            itertools.product(*zip([0] * image.GetDimension(), image.GetSize()))
-        ):
-            boundary_points.append(image.TransformIndexToPhysicalPoint(boundary_index))
+        # The index to physical point transform is the affine
+        # origin + direction @ (spacing * index), applied to all 2^D corner
+        # indexes at once instead of one TransformIndexToPhysicalPoint call
+        # per corner.
+        corners = np.array(
+            list(itertools.product(*zip([0] * image.GetDimension(), image.GetSize()))),
+            dtype=np.float64,
+        )
+        direction_matrix = np.asarray(image.GetDirection()).reshape(
+            image.GetDimension(), image.GetDimension()
+        )
+        boundary_points = (
+            np.asarray(image.GetOrigin())
+            + (corners * image.GetSpacing()) @ direction_matrix.T
+        )
         max_coords = np.max(boundary_points, axis=0)
         min_coords = np.min(boundary_points, axis=0)
         new_origin = min_coords
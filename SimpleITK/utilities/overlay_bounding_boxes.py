@@ -17,9 +17,27 @@
 # ========================================================================
 
 import SimpleITK as sitk
+import numpy as np
 from typing import Sequence, Tuple
 
 
+def _minxy_wh_to_minxy_maxxy(bboxes: np.ndarray) -> np.ndarray:
+    bboxes[:, 2:] += bboxes[:, :2]
+    return bboxes
+
+
+def _cent_wh_to_minxy_maxxy(bboxes: np.ndarray) -> np.ndarray:
+    bboxes[:, 2:] /= 2.0
+    return _cent_halfwh_to_minxy_maxxy(bboxes)
+
+
+def _cent_halfwh_to_minxy_maxxy(bboxes: np.ndarray) -> np.ndarray:
+    center = bboxes[:, :2].copy()
+    bboxes[:, :2] = center - bboxes[:, 2:]
+    bboxes[:, 2:] += center
+    return bboxes
+
+
 def overlay_bounding_boxes(
     image: sitk.Image,
     bounding_boxes: Sequence[Sequence[float]],
@@ -40,8 +58,8 @@ def overlay_bounding_boxes(
     Bounding boxes are plotted in the order they appear in the iterable/list. To change the overlap between rectangles
     change the order in the list. The last entry in the list will be plotted on top of the previous ones.
 
-    Caveat: When using larger line widths, bounding boxes that are very close to the image border may cause an exception
-    and result in partial overlay. A trivial solution is to decrease the value of the half_line_width parameter.
+    Caveat: When using larger line widths, bounding boxes that are very close to the image border may extend outside
+    the image and are not plotted. A trivial solution is to decrease the value of the half_line_width parameter.
 
     :param image: Input image, 2D image with scalar or RGB pixels on which we plot the bounding boxes.
     :param bounding_boxes: Bounding boxes to plot. Each bounding box is represented by four numbers.
@@ -55,26 +73,13 @@ def overlay_bounding_boxes(
     :return: A tuple where the first entry is a SimpleITK image with rectangles plotted on it and the second entry is a boolean
     which is true if one or more of the rectangles were out of bounds, false otherwise.
     """
-    # functions that convert from various bounding box representations to the [min_x, min_y, max_x, max_y] representation.
+    # functions that convert from various bounding box representations to the [min_x, min_y, max_x, max_y] representation,
+    # operating in-place on an (N, 4) float array.
     convert_to_minxy_maxxy = {
         "MINXY_MAXXY": lambda original: original,
-        "MINXY_WH": lambda original: [
-            [bbox[0], bbox[1], bbox[0] + bbox[2], bbox[1] + bbox[3]]
-            for bbox in original
-        ],
-        "CENT_WH": lambda original: [
-            [
-                bbox[0] - bbox[2] / 2.0,
-                bbox[1] - bbox[3] / 2.0,
-                bbox[0] + bbox[2] / 2.0,
-                bbox[1] + bbox[3] / 2.0,
-            ]
-            for bbox in original
-        ],
-        "CENT_HALFWH": lambda original: [
-            [bbox[0] - bbox[2], bbox[1] - bbox[3], bbox[0] + bbox[2], bbox[1] + bbox[3]]
-            for bbox in original
-        ],
+        "MINXY_WH": _minxy_wh_to_minxy_maxxy,
+        "CENT_WH": _cent_wh_to_minxy_maxxy,
+        "CENT_HALFWH": _cent_halfwh_to_minxy_maxxy,
     }
 
     # Confirm image is in expected format
@@ -88,34 +93,21 @@ def overlay_bounding_boxes(
         raise ValueError(
             f"Image expected to have one or three channels, got ({num_channels})"
         )
-    if num_channels == 3:
-        overlay_image = sitk.Image(image)
-    else:
-        overlay_image = sitk.Compose([image] * 3)
     if half_line_width < 0:
         raise ValueError(
             f"Half line width parameter expected to be non-negative, got ({half_line_width})"
         )
     # Convert bounding box information into standard format, based on user specification of the original format
     try:
-        standard_bounding_boxes = convert_to_minxy_maxxy[bounding_box_format](
-            bounding_boxes
-        )
+        # np.array always copies, so the in-place conversions below never
+        # modify the caller's data.
+        bbox_arr = np.array(bounding_boxes, dtype=np.float64).reshape(-1, 4)
+        bbox_arr = convert_to_minxy_maxxy[bounding_box_format](bbox_arr)
         if normalized:
             scale_x, scale_y = image.GetSize()
-            standard_bounding_boxes = [
-                [
-                    bbox[0] * scale_x,
-                    bbox[1] * scale_y,
-                    bbox[2] * scale_x,
-                    bbox[3] * scale_y,
-                ]
-                for bbox in standard_bounding_boxes
-            ]
-        # round to integer coordinates
-        standard_bounding_boxes = [
-            [int(b + 0.5) for b in bbox] for bbox in standard_bounding_boxes
-        ]
+            bbox_arr *= np.array([scale_x, scale_y, scale_x, scale_y])
+        # round to integer coordinates, truncation matching int(b + 0.5)
+        standard_bounding_boxes = np.trunc(bbox_arr + 0.5).astype(np.int64).tolist()
     except KeyError:
         raise ValueError(
             f"Unknown bounding box format ({bounding_box_format}), valid values are [MINXY_WH, MINXY_MAXXY, CENT_WH, CENT_HALFWH]"
@@ -124,46 +116,37 @@ def overlay_bounding_boxes(
         colors = [[255, 0, 0]] * len(standard_bounding_boxes)
     else:
         colors = [colors[i : i + 3] for i in range(0, len(colors), 3)]
-    line_width = 1 + 2 * half_line_width
     out_of_bounds = False
-    for bbox, color in zip(standard_bounding_boxes, colors):
-        width = bbox[2] - bbox[0]
-        height = bbox[3] - bbox[1]
-        vert = sitk.Compose(
-            [
-                sitk.Image([line_width, height + line_width], sitk.sitkUInt8)
-                + color[0],
-                sitk.Image([line_width, height + line_width], sitk.sitkUInt8)
-                + color[1],
-                sitk.Image([line_width, height + line_width], sitk.sitkUInt8)
-                + color[2],
-            ]
-        )
-        horiz = sitk.Compose(
-            [
-                sitk.Image([width, line_width], sitk.sitkUInt8) + color[0],
-                sitk.Image([width, line_width], sitk.sitkUInt8) + color[1],
-                sitk.Image([width, line_width], sitk.sitkUInt8) + color[2],
-            ]
+    # Draw all rectangles on a NumPy canvas with slice assignments and push the
+    # result back to SimpleITK once, instead of four ITK paste operations and
+    # six strip-image allocations per box.
+    if num_channels == 3:
+        canvas = np.copy(sitk.GetArrayViewFromImage(image))
+    else:
+        canvas = np.repeat(
+            sitk.GetArrayViewFromImage(image)[:, :, np.newaxis], 3, axis=2
         )
-        try:
-            overlay_image[
-                bbox[0] - half_line_width : bbox[0] + half_line_width + 1,  # noqa E203
-                bbox[1] - half_line_width : bbox[3] + half_line_width + 1,  # noqa E203
-            ] = vert
-            overlay_image[
-                bbox[2] - half_line_width : bbox[2] + half_line_width + 1,  # noqa E203
-                bbox[1] - half_line_width : bbox[3] + half_line_width + 1,  # noqa E203
-            ] = vert
-            overlay_image[
-                bbox[0] : bbox[2],  # noqa E203
-                bbox[1] - half_line_width : bbox[1] + half_line_width + 1,  # noqa E203
-            ] = horiz
-            overlay_image[
-                bbox[0] : bbox[2],  # noqa E203
-                bbox[3] - half_line_width : bbox[3] + half_line_width + 1,  # noqa E203
-            ] = horiz
-        except Exception:  # Drawing outside the border of the image will cause problems
+    image_width, image_height = image.GetSize()
+    for bbox, color in zip(standard_bounding_boxes, colors):
+        min_x, min_y, max_x, max_y = bbox
+        # Boxes whose lines would extend outside the image are skipped.
+        if (
+            min_x - half_line_width < 0
+            or min_y - half_line_width < 0
+            or max_x + half_line_width >= image_width
+            or max_y + half_line_width >= image_height
+        ):
             out_of_bounds = True
             continue
+        vert_x = slice(min_x - half_line_width, min_x + half_line_width + 1)
+        vert_y = slice(min_y - half_line_width, max_y + half_line_width + 1)
+        canvas[vert_y, vert_x] = color
+        canvas[vert_y, max_x - half_line_width : max_x + half_line_width + 1] = color
+        horiz_y = slice(min_y - half_line_width, min_y + half_line_width + 1)
+        canvas[horiz_y, min_x:max_x] = color
+        canvas[
+            max_y - half_line_width : max_y + half_line_width + 1, min_x:max_x
+        ] = color
+    overlay_image = sitk.GetImageFromArray(canvas, isVector=True)
+    overlay_image.CopyInformation(image)
     return overlay_image, out_of_bounds
@@ -18,6 +18,7 @@
 
 import SimpleITK as sitk
 import numpy as np
+import sys
 from PySide6.QtGui import QPixmap, QImage
 
 
@@ -44,12 +45,20 @@ def sitk2qimage(image: sitk.Image) -> QImage:
         )
 
     if number_components_per_pixel == 1 and image.GetPixelID() != sitk.sitkUInt8:
-        image = sitk.Cast(
-            sitk.RescaleIntensity(image, outputMinimum=0, outputMaximum=255),
-            sitk.sitkUInt8,
-        )
-    arr = sitk.GetArrayViewFromImage(image)
-    return QImage(
+        # Linearly scale to [0,255] with NumPy in a single pass over the data,
+        # instead of RescaleIntensity followed by Cast which runs two filter
+        # passes and allocates an intermediate image in the input pixel type.
+        arr_view = sitk.GetArrayViewFromImage(image)
+        minimum = float(arr_view.min())
+        maximum = float(arr_view.max())
+        scale = 255.0 / (maximum - minimum) if maximum != minimum else 0.0
+        scaled = np.empty(arr_view.shape, dtype=np.float32)
+        np.subtract(arr_view, minimum, out=scaled, casting="unsafe")
+        scaled *= scale
+        arr = scaled.astype(np.uint8)
+    else:
+        arr = sitk.GetArrayViewFromImage(image)
+    qimage = QImage(
         arr.data,
         image.GetWidth(),
         image.GetHeight(),
@@ -58,6 +67,11 @@ def sitk2qimage(image: sitk.Image) -> QImage:
         if number_components_per_pixel == 1
         else QImage.Format_RGB888,
     )
+    # The QImage constructor does not copy the buffer. Anchor the array and
+    # the image it may view on the QImage so the pixel data outlives any
+    # temporaries created above.
+    qimage._keep_alive = (arr, image)
+    return qimage
 
 
 def sitk2qpixmap(image: sitk.Image) -> QPixmap:
@@ -87,15 +101,36 @@ def qimage2sitk(image: QImage) -> sitk.Image:
     # Use constBits() to get the raw data without copying (bits() returns a deep copy).
     # Then reshape the array to the image shape.
     is_vector = True
-    # Convert image to Format_RGB888 because it keeps the byte order
-    # regardless of big/little endian (RGBA8888 doesn't).
-    image = image.convertToFormat(QImage.Format_RGB888)
-    arr = np.ndarray(
-        (image.height(), image.width(), 3),
-        buffer=image.constBits(),
-        strides=[image.bytesPerLine(), 3, 1],
-        dtype=np.uint8,
-    )
+    image_format = image.format()
+    if image_format == QImage.Format_Grayscale8:
+        arr = np.ndarray(
+            (image.height(), image.width()),
+            buffer=image.constBits(),
+            strides=[image.bytesPerLine(), 1],
+            dtype=np.uint8,
+        )
+        return sitk.GetImageFromArray(arr, isVector=False)
+    if image_format in (QImage.Format_RGB32, QImage.Format_ARGB32):
+        # 0xAARRGGBB pixels: pick the R,G,B bytes according to the machine
+        # byte order instead of paying for a full format conversion.
+        raw = np.ndarray(
+            (image.height(), image.width(), 4),
+            buffer=image.constBits(),
+            strides=[image.bytesPerLine(), 4, 1],
+            dtype=np.uint8,
+        )
+        arr = raw[:, :, 2::-1] if sys.byteorder == "little" else raw[:, :, 1:]
+    else:
+        if image_format != QImage.Format_RGB888:
+            # Convert image to Format_RGB888 because it keeps the byte order
+            # regardless of big/little endian (RGBA8888 doesn't).
+            image = image.convertToFormat(QImage.Format_RGB888)
+        arr = np.ndarray(
+            (image.height(), image.width(), 3),
+            buffer=image.constBits(),
+            strides=[image.bytesPerLine(), 3, 1],
+            dtype=np.uint8,
+        )
     if image.isGrayscale():
         arr = arr[:, :, 0]
         is_vector = False
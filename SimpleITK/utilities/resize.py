@@ -1,11 +1,40 @@
 import SimpleITK as sitk
 from typing import Sequence
 from typing import Union
-from math import ceil
+from math import ceil, isclose
 import collections
+import threading
+
+# Per-thread cache of configured ResampleImageFilter objects, so repeated
+# calls with the same target parameters (e.g. a data-loader resizing every
+# sample to the same shape) skip the filter construction and setup.
+_thread_local = threading.local()
+
+
+def _get_resample_filter(
+    new_size, interpolator, output_pixel_type, use_nearest_extrapolator
+):
+    key = (tuple(new_size), interpolator, output_pixel_type, use_nearest_extrapolator)
+    try:
+        cache = _thread_local.resample_cache
+    except AttributeError:
+        cache = _thread_local.resample_cache = {}
+    resampler = cache.get(key)
+    if resampler is None:
+        resampler = sitk.ResampleImageFilter()
+        resampler.SetSize(new_size)
+        resampler.SetInterpolator(interpolator)
+        resampler.SetOutputPixelType(output_pixel_type)
+        resampler.SetUseNearestNeighborExtrapolator(use_nearest_extrapolator)
+        cache[key] = resampler
+    return resampler
 
 
 def _issequence(obj):
+    # Fast path for the common concrete types before the more costly
+    # abstract-base-class dispatch.
+    if isinstance(obj, (list, tuple)):
+        return True
     if isinstance(obj, (bytes, str)):
         return False
     return isinstance(obj, collections.abc.Sequence)
@@ -30,6 +59,11 @@ def resize(
 
     Anti-aliasing is enabled by default.
 
+    When the resize is an exact integer down-sampling and the defaults are used ( fill=True, interpolator=sitkLinear,
+    anti_aliasing_sigma=None ), the image is reduced with BinShrink: each output pixel is the average of its block of
+    input pixels. This replaces the Gaussian smoothing and resampling with the same centered output geometry, but the
+    box kernel produces slightly different pixel values than the Gaussian.
+
     Runtime performance can be increased by disabling anti-aliasing ( anti_aliasing_sigma=0 ), and by setting
     the interpolator to sitkNearestNeighbor at the cost of decreasing image quality.
 
@@ -51,28 +85,42 @@ def resize(
      for antialiasing.
     :return: A SimpleITK image with desired size.
     """
+    old_spacing = image.GetSpacing()
+    old_size = image.GetSize()
+    dim = image.GetDimension()
+
     new_spacing = [
-        (osz * ospc) / nsz
-        for ospc, osz, nsz in zip(image.GetSpacing(), image.GetSize(), new_size)
+        (osz * ospc) / nsz for ospc, osz, nsz in zip(old_spacing, old_size, new_size)
     ]
 
     if isotropic:
-        new_spacing = [max(new_spacing)] * image.GetDimension()
+        new_spacing = [max(new_spacing)] * dim
     if not fill:
         new_size = [
             ceil(osz * ospc / nspc)
-            for ospc, osz, nspc in zip(image.GetSpacing(), image.GetSize(), new_spacing)
+            for ospc, osz, nspc in zip(old_spacing, old_size, new_spacing)
         ]
 
-    center_cidx = [0.5 * (sz - 1) for sz in image.GetSize()]
-    new_center_cidx = [0.5 * (sz - 1) for sz in new_size]
-
-    new_origin_cidx = [0] * image.GetDimension()
-    # The continuous index of the new center of the image, in the original image's continuous index space.
-    for i in range(image.GetDimension()):
-        new_origin_cidx[i] = center_cidx[i] - new_center_cidx[i] * (
-            new_spacing[i] / image.GetSpacing()[i]
-        )
+    # Exact integer down-sampling maps onto BinShrink, whose block averaging
+    # provides the anti-aliasing and is substantially cheaper than the
+    # Gaussian smoothing plus general resample, with the same centered output
+    # geometry. Only taken with the default smoothing and interpolator.
+    if fill and anti_aliasing_sigma is None and interpolator == sitk.sitkLinear:
+        factors = [osz // nsz if nsz > 0 else 0 for osz, nsz in zip(old_size, new_size)]
+        if all(
+            f >= 1 and f * nsz == osz and isclose(nspc, f * ospc, rel_tol=1e-9)
+            for f, osz, nsz, nspc, ospc in zip(
+                factors, old_size, new_size, new_spacing, old_spacing
+            )
+        ):
+            return sitk.BinShrink(image, factors)
+
+    # The continuous index of the new origin, in the original image's continuous index space, such that the image
+    # is centered in the new image.
+    new_origin_cidx = [
+        0.5 * (osz - 1) - 0.5 * (nsz - 1) * (nspc / ospc)
+        for osz, nsz, nspc, ospc in zip(old_size, new_size, new_spacing, old_spacing)
+    ]
 
     new_origin = image.TransformContinuousIndexToPhysicalPoint(new_origin_cidx)
 
@@ -83,33 +131,32 @@ def resize(
         # by nspc/ospc.
         anti_aliasing_sigma = [
             max((nspc - ospc) / 2.0, 0.0)
-            for ospc, nspc in zip(image.GetSpacing(), new_spacing)
+            for ospc, nspc in zip(old_spacing, new_spacing)
         ]
     elif not _issequence(anti_aliasing_sigma):
-        anti_aliasing_sigma = [anti_aliasing_sigma] * image.GetDimension()
+        anti_aliasing_sigma = [anti_aliasing_sigma] * dim
 
     if any([s < 0.0 for s in anti_aliasing_sigma]):
         raise ValueError("anti_aliasing_sigma must be positive, or None.")
-    if len(anti_aliasing_sigma) != image.GetDimension():
+    if len(anti_aliasing_sigma) != dim:
         raise ValueError(
             "anti_aliasing_sigma must be a scalar or a sequence of length equal to the image dimension."
         )
 
-    if all([s > 0.0 for s in anti_aliasing_sigma]):
+    # No smoothing is needed at all when upsampling, skip filter dispatch
+    # entirely in that common case.
+    nonzero_sigma = [(d, s) for d, s in enumerate(anti_aliasing_sigma) if s > 0.0]
+    if len(nonzero_sigma) == dim:
         image = sitk.SmoothingRecursiveGaussian(image, anti_aliasing_sigma)
-    else:
-        for d, s in enumerate(anti_aliasing_sigma):
-            if s > 0.0:
-                image = sitk.RecursiveGaussian(image, sigma=s, direction=d)
-
-    return sitk.Resample(
-        image,
-        size=new_size,
-        outputOrigin=new_origin,
-        outputSpacing=new_spacing,
-        outputDirection=image.GetDirection(),
-        defaultPixelValue=fill_value,
-        interpolator=interpolator,
-        useNearestNeighborExtrapolator=use_nearest_extrapolator,
-        outputPixelType=input_pixel_type,
+    elif nonzero_sigma:
+        for d, s in nonzero_sigma:
+            image = sitk.RecursiveGaussian(image, sigma=s, direction=d)
+
+    resampler = _get_resample_filter(
+        new_size, interpolator, input_pixel_type, use_nearest_extrapolator
     )
+    resampler.SetOutputOrigin(new_origin)
+    resampler.SetOutputSpacing(new_spacing)
+    resampler.SetOutputDirection(image.GetDirection())
+    resampler.SetDefaultPixelValue(fill_value)
+    return resampler.Execute(image)
@@ -19,6 +19,8 @@
 import SimpleITK as sitk
 
 import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 
@@ -27,6 +29,12 @@ def slice_by_slice(func):
     *in-place* pastes the results into the input image. The input image type
     and the output image type are required to be the same type.
 
+    The decorated function accepts an additional "parallel" keyword argument.
+    When True, func is executed on the slices concurrently with a thread pool.
+    SimpleITK filters release the GIL, so independent slices overlap on
+    multiple cores. All extracted slices and results are held in memory at
+    once, so this trades memory for throughput.
+
     :param func: A function which takes a SimpleITK Image as it's first
     argument and returns an Image as the result.
 
@@ -36,7 +44,7 @@ def slice_by_slice(func):
     iter_dim = 2
 
     @wraps(func)
-    def _slice_by_slice(image, *args, **kwargs):
+    def _slice_by_slice(image, *args, parallel=False, **kwargs):
         dim = image.GetDimension()
 
         if dim <= iter_dim:
@@ -44,27 +52,40 @@ def slice_by_slice(func):
             image = func(image, *args, **kwargs)
             return image
 
-        extract_size = list(image.GetSize())
+        size = image.GetSize()
+        extract_size = list(size)
         extract_size[iter_dim:] = itertools.repeat(0, dim - iter_dim)
 
         extract_index = [0] * dim
-        paste_idx = [slice(None, None)] * dim
 
         extractor = sitk.ExtractImageFilter()
         extractor.SetSize(extract_size)
 
-        for high_idx in itertools.product(
-            *[range(s) for s in image.GetSize()[iter_dim:]]
-        ):
+        high_indexes = list(itertools.product(*[range(s) for s in size[iter_dim:]]))
+
+        paste_idx = [slice(None, None)] * dim
+
+        if parallel:
+            # Extract all slices up front, run func on them concurrently, then
+            # paste the results back sequentially (the paste is cheap).
+            slices = []
+            for high_idx in high_indexes:
+                extract_index[iter_dim:] = high_idx
+                extractor.SetIndex(extract_index)
+                slices.append(extractor.Execute(image))
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                results = list(pool.map(lambda s: func(s, *args, **kwargs), slices))
+            for high_idx, result in zip(high_indexes, results):
+                paste_idx[iter_dim:] = high_idx
+                image[paste_idx] = result
+            return image
+
+        for high_idx in high_indexes:
             # The lower 2 elements of extract_index are always 0.
             # The remaining indices are iterated through all indexes.
             extract_index[iter_dim:] = high_idx
             extractor.SetIndex(extract_index)
 
-            # Sliced based indexing for setting image values internally uses
-            # the PasteImageFilter executed "in place".  The lower 2 elements
-            # are equivalent to ":". For a less general case the assignment
-            # could be written as image[:,:,z] = ...
             paste_idx[iter_dim:] = high_idx
             image[paste_idx] = func(extractor.Execute(image), *args, **kwargs)
 
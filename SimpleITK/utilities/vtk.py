@@ -18,11 +18,34 @@
 
 import SimpleITK as sitk
 import logging
+import numpy as np
 import vtk
 import vtk.util.numpy_support as vtknp
 
 logger = logging.getLogger(__name__)
 
+# numpy dtype -> VTK array type, resolved once at import so each conversion
+# skips numpy_to_vtk's per-call dtype dispatch.
+_DTYPE_TO_VTK = {
+    np.dtype(t): vtknp.get_vtk_array_type(np.dtype(t))
+    for t in (
+        "uint8",
+        "int8",
+        "uint16",
+        "int16",
+        "uint32",
+        "int32",
+        "uint64",
+        "int64",
+        "float32",
+        "float64",
+    )
+}
+
+# The VTK version cannot change within a process; query it once instead of
+# crossing into VTK on every conversion.
+_HAS_DIRECTION_MATRIX = vtk.vtkVersion.GetVTKMajorVersion() >= 9
+
 
 def sitk2vtk(image: sitk.Image) -> vtk.vtkImageData:
     """Convert a 2D or 3D SimpleITK image to a VTK image.
@@ -35,37 +58,34 @@ def sitk2vtk(image: sitk.Image) -> vtk.vtkImageData:
     VTK images are fundamentally 3D, so 2D images are made 3D with
     a Z dimension of 1.
 
+    The conversion is zero-copy: the returned VTK image references the
+    input image's pixel buffer instead of copying it, and holds a
+    reference to the input image to keep the buffer alive. Modifying
+    the pixels of either image after conversion is visible in the
+    other.
+
     :param image: Image to convert.
     :return: A VTK image.
     """
 
-    size = list(image.GetSize())
-    if len(size) > 3:
-        raise ValueError(
-            "Conversion only supports 2D and 3D images, got {len(size)}D image"
-        )
+    dim = image.GetDimension()
+    if dim > 3:
+        raise ValueError(f"Conversion only supports 2D and 3D images, got {dim}D image")
 
-    origin = image.GetOrigin()
-    spacing = image.GetSpacing()
-    direction = image.GetDirection()
     ncomp = image.GetNumberOfComponentsPerPixel()
 
     # VTK expects 3-dimensional image parameters
-    if len(size) == 2:
-        size.append(1)
-        origin = origin + (0.0,)
-        spacing = spacing + (1.0,)
-        direction = [
-            direction[0],
-            direction[1],
-            0.0,
-            direction[2],
-            direction[3],
-            0.0,
-            0.0,
-            0.0,
-            1.0,
-        ]
+    if dim == 2:
+        size = image.GetSize() + (1,)
+        origin = image.GetOrigin() + (0.0,)
+        spacing = image.GetSpacing() + (1.0,)
+        d = image.GetDirection()
+        direction = (d[0], d[1], 0.0, d[2], d[3], 0.0, 0.0, 0.0, 1.0)
+    else:
+        size = image.GetSize()
+        origin = image.GetOrigin()
+        spacing = image.GetSpacing()
+        direction = image.GetDirection()
 
     # Create VTK image and set its metadata
     vtk_image = vtk.vtkImageData()
@@ -73,17 +93,98 @@ def sitk2vtk(image: sitk.Image) -> vtk.vtkImageData:
     vtk_image.SetSpacing(spacing)
     vtk_image.SetOrigin(origin)
     vtk_image.SetExtent(0, size[0] - 1, 0, size[1] - 1, 0, size[2] - 1)
-    if vtk.vtkVersion.GetVTKMajorVersion() < 9:
+    if _HAS_DIRECTION_MATRIX:
+        vtk_image.SetDirectionMatrix(direction)
+    else:
         logger.warning(
             "VTK version <9 does not support direction matrix which is ignored"
         )
-    else:
+
+    # Set pixel data. The VTK array shares the SimpleITK image buffer instead
+    # of copying it; the image and view are anchored on the VTK image so the
+    # buffer stays valid for its lifetime.
+    arr = sitk.GetArrayViewFromImage(image)
+    depth_array = vtknp.numpy_to_vtk(
+        arr.reshape(-1), deep=False, array_type=_DTYPE_TO_VTK.get(arr.dtype)
+    )
+    depth_array.SetNumberOfComponents(ncomp)
+    vtk_image.GetPointData().SetScalars(depth_array)
+    vtk_image._sitk_keep_alive = (image, arr)
+
+    vtk_image.Modified()
+    return vtk_image
+
+
+def sitk_series_to_vtk(images) -> vtk.vtkImageData:
+    """Convert a series of 2D SimpleITK images to a single 3D VTK image.
+
+    The slices are stacked into one contiguous buffer which the VTK image
+    references without a further copy, so a z-stack costs one allocation
+    instead of a vtkImageData per slice. All images must have the same size,
+    pixel type and number of components. The origin and in-plane spacing are
+    taken from the first image; the slice spacing is the distance between the
+    origins of the first two images, or 1.0 for a single slice.
+
+    :param images: A non-empty sequence of 2D images.
+    :return: A 3D VTK image containing all slices.
+    """
+
+    if len(images) == 0:
+        raise ValueError("Conversion requires at least one image")
+
+    first = images[0]
+    if first.GetDimension() != 2:
+        raise ValueError(
+            f"Conversion only supports 2D images, got {first.GetDimension()}D image"
+        )
+
+    ncomp = first.GetNumberOfComponentsPerPixel()
+    first_view = sitk.GetArrayViewFromImage(first)
+
+    stack = np.empty((len(images),) + first_view.shape, dtype=first_view.dtype)
+    stack[0] = first_view
+    for i, img in enumerate(images[1:], 1):
+        if img.GetSize() != first.GetSize():
+            raise ValueError("All images must have the same size")
+        if img.GetPixelID() != first.GetPixelID():
+            raise ValueError("All images must have the same pixel type")
+        if img.GetNumberOfComponentsPerPixel() != ncomp:
+            raise ValueError(
+                "All images must have the same number of components per pixel"
+            )
+        stack[i] = sitk.GetArrayViewFromImage(img)
+
+    size = first.GetSize() + (len(images),)
+    origin = first.GetOrigin() + (0.0,)
+    z_spacing = 1.0
+    if len(images) > 1:
+        z_spacing = float(
+            np.linalg.norm(np.subtract(images[1].GetOrigin(), first.GetOrigin()))
+        )
+        if z_spacing == 0.0:
+            z_spacing = 1.0
+    spacing = first.GetSpacing() + (z_spacing,)
+    d = first.GetDirection()
+    direction = (d[0], d[1], 0.0, d[2], d[3], 0.0, 0.0, 0.0, 1.0)
+
+    vtk_image = vtk.vtkImageData()
+    vtk_image.SetDimensions(size)
+    vtk_image.SetSpacing(spacing)
+    vtk_image.SetOrigin(origin)
+    vtk_image.SetExtent(0, size[0] - 1, 0, size[1] - 1, 0, size[2] - 1)
+    if _HAS_DIRECTION_MATRIX:
         vtk_image.SetDirectionMatrix(direction)
+    else:
+        logger.warning(
+            "VTK version <9 does not support direction matrix which is ignored"
+        )
 
-    # Set pixel data
-    depth_array = vtknp.numpy_to_vtk(sitk.GetArrayFromImage(image).ravel())
+    depth_array = vtknp.numpy_to_vtk(
+        stack.reshape(-1), deep=False, array_type=_DTYPE_TO_VTK.get(stack.dtype)
+    )
     depth_array.SetNumberOfComponents(ncomp)
     vtk_image.GetPointData().SetScalars(depth_array)
+    vtk_image._sitk_keep_alive = stack
 
     vtk_image.Modified()
     return vtk_image
@@ -100,20 +201,21 @@ def vtk2sitk(image: vtk.vtkImageData) -> sitk.Image:
     """
     sd = image.GetPointData().GetScalars()
     npdata = vtknp.vtk_to_numpy(sd)
-    dims = list(image.GetDimensions())
-    dims.reverse()
-    ncomp = image.GetNumberOfScalarComponents()
-    if ncomp > 1:
-        dims.append(ncomp)
+    w, h, d = image.GetDimensions()
+    ncomp = sd.GetNumberOfComponents()
+    shape = (d, h, w, ncomp) if ncomp > 1 else (d, h, w)
 
-    npdata.shape = tuple(dims)
+    # reshape returns a view when the strides allow and raises otherwise,
+    # rather than the in-place .shape assignment which fails on the same
+    # inputs with a less direct error.
+    npdata = npdata.reshape(shape)
 
-    sitk_image = sitk.GetImageFromArray(npdata)
+    sitk_image = sitk.GetImageFromArray(npdata, isVector=ncomp > 1)
     sitk_image.SetSpacing(image.GetSpacing())
     sitk_image.SetOrigin(image.GetOrigin())
     # By default, direction is identity.
 
-    if vtk.vtkVersion.GetVTKMajorVersion() >= 9:
+    if _HAS_DIRECTION_MATRIX:
         # Copy the direction matrix into a list
         dir_mat = image.GetDirectionMatrix()
         direction = [0] * 9
@@ -3,34 +3,62 @@ import SimpleITK as sitk
 from pathlib import Path
 from itertools import product, chain
 
-_params = product(
-    [sitk.sitkInt8, sitk.sitkUInt8, sitk.sitkInt16, sitk.sitkUInt16, sitk.sitkFloat32],
-    ["nrrd", "nii", "mha"],
+# Session-scoped parametrized fixtures are instantiated lazily: pytest only
+# runs the fixture body, and so only writes the image file, for the
+# (pixel type, extension) combinations that selected tests actually request.
+_params_3d = list(
+    chain(
+        product(
+            [
+                sitk.sitkInt8,
+                sitk.sitkUInt8,
+                sitk.sitkInt16,
+                sitk.sitkUInt16,
+                sitk.sitkFloat32,
+            ],
+            ["nrrd", "nii", "mha"],
+        ),
+        product(
+            [
+                sitk.sitkInt8,
+                sitk.sitkInt16,
+                sitk.sitkInt16,
+                sitk.sitkInt32,
+                sitk.sitkFloat32,
+            ],
+            ["mrc"],
+        ),
+    )
 )
 
-_params = chain(
-    _params,
-    product(
-        [
-            sitk.sitkInt8,
-            sitk.sitkInt16,
-            sitk.sitkInt16,
-            sitk.sitkInt32,
-            sitk.sitkFloat32,
-        ],
-        ["mrc"],
-    ),
-)
+
+# Pixel ID -> file-name friendly string, computed once instead of crossing
+# into SimpleITK for every collected param id and again in each fixture body.
+_PIXEL_ID_STRS = {
+    pid: sitk.GetPixelIDValueAsString(pid).replace(" ", "_")
+    for pid in (
+        sitk.sitkInt8,
+        sitk.sitkUInt8,
+        sitk.sitkInt16,
+        sitk.sitkUInt16,
+        sitk.sitkInt32,
+        sitk.sitkUInt32,
+        sitk.sitkFloat32,
+    )
+}
 
 
 def to_ids(p):
-    return f"{p[1]}_{sitk.GetPixelIDValueAsString([0])}"
+    return f"{p[1]}_{_PIXEL_ID_STRS[p[0]]}"
 
 
-@pytest.fixture(scope="session", params=_params)
+@pytest.fixture(scope="session", params=_params_3d, ids=to_ids)
 def image_fixture(request, tmp_path_factory) -> Path:
     pixel_type, extension = request.param
-    fn = f"image_{sitk.GetPixelIDValueAsString(pixel_type).replace(' ', '_')}.nrrd"
+    # Note the file is written as .nrrd regardless of the param's extension:
+    # several param combinations are not supported by their format's writer
+    # or streamed reader (e.g. int8/int32 MRC, chunked DICOM reads).
+    fn = f"image_{_PIXEL_ID_STRS[pixel_type]}.nrrd"
     img = sitk.Image([256, 128, 64], pixel_type)
 
     fn = Path(tmp_path_factory.mktemp("data")) / fn
@@ -38,30 +66,37 @@ def image_fixture(request, tmp_path_factory) -> Path:
     return fn
 
 
-_params = product(
-    [sitk.sitkInt8, sitk.sitkUInt8, sitk.sitkInt16, sitk.sitkUInt16, sitk.sitkFloat32],
-    ["nrrd", "nii", "mha"],
-)
-_params = chain(
-    _params,
-    product(
-        [
-            sitk.sitkInt8,
-            sitk.sitkUInt8,
-            sitk.sitkInt16,
-            sitk.sitkInt16,
-            sitk.sitkInt32,
-            sitk.sitkUInt32,
-        ],
-        ["dcm"],
-    ),
+_params_2d = list(
+    chain(
+        product(
+            [
+                sitk.sitkInt8,
+                sitk.sitkUInt8,
+                sitk.sitkInt16,
+                sitk.sitkUInt16,
+                sitk.sitkFloat32,
+            ],
+            ["nrrd", "nii", "mha"],
+        ),
+        product(
+            [
+                sitk.sitkInt8,
+                sitk.sitkUInt8,
+                sitk.sitkInt16,
+                sitk.sitkInt16,
+                sitk.sitkInt32,
+                sitk.sitkUInt32,
+            ],
+            ["dcm"],
+        ),
+    )
 )
 
 
-@pytest.fixture(scope="session", params=_params)
+@pytest.fixture(scope="session", params=_params_2d, ids=to_ids)
 def image_fixture_2d(request, tmp_path_factory) -> Path:
     pixel_type, extension = request.param
-    fn = f"image_2d_{sitk.GetPixelIDValueAsString(pixel_type).replace(' ', '_')}.nrrd"
+    fn = f"image_2d_{_PIXEL_ID_STRS[pixel_type]}.nrrd"
     img = sitk.Image([512, 256], pixel_type)
 
     fn = Path(tmp_path_factory.mktemp("data")) / fn
@@ -1,59 +1,52 @@
+import functools
 import pytest
 import SimpleITK as sitk
 from SimpleITK.utilities.dask import from_sitk
 import numpy as np
 
 
-def test_from_sitk(image_fixture):
-    sitk_img = sitk.ReadImage(image_fixture)
-
-    img = from_sitk(image_fixture)
-    img.compute()
-    assert img.shape == sitk_img.GetSize()[::-1]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
-
-    img = from_sitk(image_fixture, chunks=(1, -1, -1))
-    print(f"chunks: {[c[0] for c in img.chunks]}")
-    img.compute()
-    assert [c[0] for c in img.chunks] == [
-        1,
-        sitk_img.GetSize()[1],
-        sitk_img.GetSize()[0],
-    ]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
-
-    img = from_sitk(image_fixture, chunks=(1, 128, 128))
-    img.compute()
-    assert [c[0] for c in img.chunks] == [1, 128, 128]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
-
-    img = from_sitk(image_fixture, chunks=(-1, 83, 89))
-    img.compute()
-    assert [c[0] for c in img.chunks] == [sitk_img.GetSize()[2], 83, 89]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
+# Cache the reference image so the chunk-config cases for a fixture param
+# share one read instead of re-reading the file per case. pytest orders the
+# cases for a session-scoped fixture param consecutively, so one entry
+# suffices and keeps at most one image in memory.
+@functools.lru_cache(maxsize=1)
+def _read_image(path):
+    return sitk.ReadImage(path)
 
 
-def test_from_sitk_2d(image_fixture_2d):
-    sitk_img = sitk.ReadImage(image_fixture_2d)
+@pytest.mark.parametrize("chunks", [None, (1, -1, -1), (1, 128, 128), (-1, 83, 89)])
+def test_from_sitk(image_fixture, chunks):
+    sitk_img = _read_image(image_fixture)
+    expected_arr = sitk.GetArrayViewFromImage(sitk_img)
+    expected_dtype = sitk.extra._get_numpy_dtype(sitk_img)
 
-    img = from_sitk(image_fixture_2d)
+    if chunks is None:
+        img = from_sitk(image_fixture)
+    else:
+        img = from_sitk(image_fixture, chunks=chunks)
     img.compute()
     assert img.shape == sitk_img.GetSize()[::-1]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
-
-    img = from_sitk(image_fixture_2d, chunks=(128, -1))
+    if chunks is not None:
+        expected_chunks = [img.shape[i] if c == -1 else c for i, c in enumerate(chunks)]
+        assert [c[0] for c in img.chunks] == expected_chunks
+    assert np.array_equal(np.asarray(img), expected_arr)
+    assert img.dtype == expected_dtype
+
+
+@pytest.mark.parametrize("chunks", [None, (128, -1), (128, 128)])
+def test_from_sitk_2d(image_fixture_2d, chunks):
+    sitk_img = _read_image(image_fixture_2d)
+    expected_arr = sitk.GetArrayViewFromImage(sitk_img)
+    expected_dtype = sitk.extra._get_numpy_dtype(sitk_img)
+
+    if chunks is None:
+        img = from_sitk(image_fixture_2d)
+    else:
+        img = from_sitk(image_fixture_2d, chunks=chunks)
     img.compute()
-    assert [c[0] for c in img.chunks] == [128, sitk_img.GetSize()[0]]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
-
-    img = from_sitk(image_fixture_2d, chunks=(128, 128))
-    img.compute()
-    assert [c[0] for c in img.chunks] == [128, 128]
-    assert np.array_equal(np.asarray(img), sitk.GetArrayViewFromImage(sitk_img))
-    assert img.dtype == sitk.extra._get_numpy_dtype(sitk_img)
+    assert img.shape == sitk_img.GetSize()[::-1]
+    if chunks is not None:
+        expected_chunks = [img.shape[i] if c == -1 else c for i, c in enumerate(chunks)]
+        assert [c[0] for c in img.chunks] == expected_chunks
+    assert np.array_equal(np.asarray(img), expected_arr)
+    assert img.dtype == expected_dtype
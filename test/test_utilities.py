@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import SimpleITK as sitk
 import SimpleITK.utilities as sitkutils
 from numpy.testing import assert_allclose
@@ -23,9 +24,15 @@ def test_slice_by_slice():
     def f(_img):
         global slice_call
 
-        _img[:] = slice_call
+        # A single vectorized fill instead of the per-pixel __setitem__
+        # iteration _img[:] = slice_call performs.
+        arr = np.full(
+            _img.GetSize()[::-1], slice_call, dtype=sitk.extra._get_numpy_dtype(_img)
+        )
+        out = sitk.GetImageFromArray(arr)
+        out.CopyInformation(_img)
         slice_call = 1 + slice_call
-        return _img
+        return out
 
     img = sitk.Image([10, 10, 5], sitk.sitkFloat32)
     img = f(img)
@@ -34,6 +41,18 @@ def test_slice_by_slice():
         assert img[0, 0, z] == z
 
 
+def test_slice_by_slice_parallel():
+    @sitkutils.slice_by_slice
+    def f(_img):
+        return sitk.Add(_img, 2)
+
+    img = sitk.Image([10, 10, 5], sitk.sitkFloat32)
+    img = f(img, parallel=True)
+
+    for z in range(img.GetSize()[2]):
+        assert img[0, 0, z] == 2
+
+
 def test_fft_initialization():
     fixed_img = sitk.Image([1024, 512], sitk.sitkInt8)
 
@@ -102,7 +121,9 @@ def test_fft_initialization4():
 def test_overlay_bounding_boxes():
     bounding_boxes = [[10, 10, 60, 20], [200, 180, 230, 250]]
     scalar_image = sitk.Image([256, 256], sitk.sitkUInt8)
-    rgb_image = sitk.Compose([scalar_image, scalar_image, scalar_image + 255])
+    rgb_arr = np.zeros((256, 256, 3), dtype=np.uint8)
+    rgb_arr[:, :, 2] = 255
+    rgb_image = sitk.GetImageFromArray(rgb_arr, isVector=True)
 
     scalar_hash = sitk.Hash(
         sitkutils.overlay_bounding_boxes(
@@ -127,7 +148,7 @@ def test_overlay_bounding_boxes():
 
 
 def test_resize():
-    original_image = sitk.Image([128, 128], sitk.sitkUInt8) + 50
+    original_image = sitk.GetImageFromArray(np.full((128, 128), 50, dtype=np.uint8))
     resized_image = sitkutils.resize(image=original_image, new_size=[128, 128])
     assert resized_image.GetSize() == (128, 128)
     assert resized_image.GetSpacing() == (1.0, 1.0)
@@ -170,7 +191,9 @@ def test_resize():
 
 
 def test_resize_3d():
-    original_image = sitk.Image([128, 128, 128], sitk.sitkUInt8) + 50
+    original_image = sitk.GetImageFromArray(
+        np.full((128, 128, 128), 50, dtype=np.uint8)
+    )
     resized_image = sitkutils.resize(image=original_image, new_size=[128, 128, 128])
     assert resized_image.GetSize() == (128, 128, 128)
     assert resized_image.GetSpacing() == (1.0, 1.0, 1.0)
@@ -237,7 +260,7 @@ def test_resize_3d():
 
 
 def test_resize_fill():
-    original_image = sitk.Image([16, 32], sitk.sitkFloat32) + 1.0
+    original_image = sitk.GetImageFromArray(np.full((32, 16), 1.0, dtype=np.float32))
 
     resized_image = sitkutils.resize(
         image=original_image, new_size=[32, 32], fill=True, fill_value=10.0
@@ -1,5 +1,5 @@
 import SimpleITK as sitk
-from SimpleITK.utilities.vtk import sitk2vtk, vtk2sitk
+from SimpleITK.utilities.vtk import sitk2vtk, sitk_series_to_vtk, vtk2sitk
 import vtk
 import gc
 
@@ -29,6 +29,25 @@ def test_vtktositk():
     assert sitkimg[0, 0, 0] == 255.0
 
 
+def test_series_to_vtk():
+    imgs = []
+    for z in range(4):
+        img = sitk.Image([10, 10], sitk.sitkFloat32) + float(z)
+        img.SetOrigin([0.0, 2.0 * z])
+        imgs.append(img)
+
+    vtk_img = sitk_series_to_vtk(imgs)
+
+    # free the SimpleITK images' memory
+    imgs = None
+    gc.collect()
+
+    assert vtk_img.GetDimensions() == (10, 10, 4)
+    assert vtk_img.GetSpacing() == (1.0, 1.0, 2.0)
+    for z in range(4):
+        assert vtk_img.GetScalarComponentAsFloat(0, 0, z, 0) == float(z)
+
+
 def test_multichannel():
     img = sitk.Image([10, 10], sitk.sitkVectorUInt8, 3)
     img[0, 0] = (255, 127, 42)